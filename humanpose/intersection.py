@@ -1,3 +1,6 @@
+import numpy as np
+
+
 class Intersection():
     """
     Find the intersection of two differrent sets of landmarks.
@@ -28,25 +31,30 @@ class Intersection():
         dest : list of strings
             list of landmark names defining their order in the destination data
         """
+        # Map landmark names to their source index once, so that matching
+        # the destination landmarks is a single pass of dict lookups rather
+        # than a linear search of src for every landmark.
+        src_index = {}
+        for index, landmark in enumerate(src):
+            src_index.setdefault(landmark, index)
         self._src_vec = []
         self._dest_vec = []
         self.landmarks = []
         for index, landmark in enumerate(dest):
-            if landmark in src:
-                self._src_vec.append(src.index(landmark))
+            src_id = src_index.get(landmark)
+            if src_id is not None:
+                self._src_vec.append(src_id)
                 self._dest_vec.append(index)
                 self.landmarks.append(landmark)
+        self._src_vec = np.asarray(self._src_vec, dtype=np.intp)
+        self._dest_vec = np.asarray(self._dest_vec, dtype=np.intp)
 
     def source(self, keypoints):
         """ Subset and reorder the original keypoint list. """
-        if len(keypoints.shape) == 2:
-            return keypoints[self._src_vec]
-        elif len(keypoints.shape) == 3:
-            return keypoints[:, self._src_vec]
+        # Landmarks are always the second to last axis, both for single frames
+        # (landmarks, dims) and for videos (frames, landmarks, dims).
+        return np.take(keypoints, self._src_vec, axis=keypoints.ndim - 2)
 
     def destination(self, keypoints):
         """ Subset destination keypoint list. """
-        if len(keypoints.shape) == 2:
-            return keypoints[self._dest_vec]
-        elif len(keypoints.shape) == 3:
-            return keypoints[:, self._dest_vec]
+        return np.take(keypoints, self._dest_vec, axis=keypoints.ndim - 2)
@@ -1,4 +1,8 @@
 from enum import IntFlag
+from functools import lru_cache
+from types import MappingProxyType
+
+import numpy as np
 
 
 class _Skeleton:
@@ -69,6 +73,17 @@ class _Skeleton:
         "objects": ["stick top", "stick end"]
     }
     _sided_bodyparts = ["leg", "arm", "hand", "foot", "face"]
+    # Which section of the skeleton each body part belongs to
+    _body_part_sections = {
+        "spine": Sections.MAIN,
+        "arm": Sections.MAIN,
+        "leg": Sections.MAIN,
+        "head": Sections.HEAD,
+        "face": Sections.FACE,
+        "hand": Sections.HANDS,
+        "foot": Sections.FEET,
+        "objects": Sections.OBJECTS
+    }
 
     _part_colours = {
         "spine": {
@@ -110,9 +125,11 @@ class _Skeleton:
     def __init__(self, landmarks, radius=5):
         """
         """
-        self._compute_bones(landmarks)
-        self._compute_colours(landmarks)
+        self._bones, self._colours = _build_skeleton_tables(tuple(landmarks))
         self._radius = radius
+        self._bone_cache = {}
+        self._colour_cache = {}
+        self._section_cache = {}
 
     ###########################################################################
     # Helper functions to get/print bone and colour information
@@ -120,16 +137,26 @@ class _Skeleton:
 
     def get_bone_list(self, skeleton_sections=Sections.MAIN | Sections.HEAD):
         """
-        Get the list of all bones forming the selected skeleton groups.
+        Get the array of all bones forming the selected skeleton groups.
+        The array is cached for each selection of sections and read-only.
         Parameters
         ----------
         skeleton_sections : Sections flags
             Selection of shich sections of the skeleton to draw
+
+        Returns
+        -------
+        (N,2) int32 array of landmark ids of each bone
         """
-        bones = []
-        for sec in _Skeleton.Sections:
-            if sec & skeleton_sections:
-                bones.extend(self._bones[sec])
+        key = int(skeleton_sections)
+        bones = self._bone_cache.get(key)
+        if bones is None:
+            bones = np.concatenate([np.empty((0, 2), dtype=np.int32)] + [
+                self._bones[sec]
+                for sec in _Skeleton.Sections if sec & skeleton_sections
+            ])
+            bones.flags.writeable = False
+            self._bone_cache[key] = bones
         return bones
 
     def print_bones(self,
@@ -154,15 +181,22 @@ class _Skeleton:
     def get_colour_dict(self, skeleton_sections=Sections.MAIN | Sections.HEAD):
         """
         Get the dictionary of colours for drawing the selected keypoints.
+        The dictionary is cached for each selection of sections and returned
+        as a read-only mapping.
         Parameters
         ----------
         skeleton_sections : Sections flags
             Selection of shich sections of the skeleton to draw
         """
-        colours = {}
-        for sec in _Skeleton.Sections:
-            if sec & skeleton_sections:
-                colours.update(self._colours[sec])
+        key = int(skeleton_sections)
+        colours = self._colour_cache.get(key)
+        if colours is None:
+            colours = {}
+            for sec in _Skeleton.Sections:
+                if sec & skeleton_sections:
+                    colours.update(self._colours[sec])
+            colours = MappingProxyType(colours)
+            self._colour_cache[key] = colours
         return colours
 
     def print_colours(self,
@@ -184,11 +218,51 @@ class _Skeleton:
         colours = self.get_colour_dict(skeleton_sections)
         return {landmarks[key]: val for key, val in colours.items()}
 
+    def _section_tables(self, skeleton_sections):
+        """
+        Get flat tables of the bones and points of the selected sections.
+        These are what the drawing functions need for every frame, so they are
+        computed once per selection of sections and cached.
+        Parameters
+        ----------
+        skeleton_sections : Sections flags
+            Selection of shich sections of the skeleton to draw
+
+        Returns
+        -------
+        (bones, bone_colours, points, point_colours, lines, circles)
+            bones : (N,2) int32 array of landmark ids of each bone
+            bone_colours : (N,3) array of the colour of each bone
+            points : (K,) array of landmark ids of each point
+            point_colours : (K,3) array of the colour of each point
+            lines : list of (c1, c2, colour) tuples of each bone
+            circles : list of (landmark_id, colour) tuples of each point
+        """
+        key = int(skeleton_sections)
+        tables = self._section_cache.get(key)
+        if tables is None:
+            colours = self.get_colour_dict(skeleton_sections)
+            bones = self.get_bone_list(skeleton_sections)
+            bone_colours = np.array(
+                [colours[bone] for bone in bones[:, 0].tolist()],
+                dtype=np.uint8).reshape(-1, 3)
+            points = np.array(list(colours.keys()), dtype=np.intp)
+            point_colours = np.array(list(colours.values()),
+                                     dtype=np.uint8).reshape(-1, 3)
+            # Plain Python lists for code looping over the bones and points
+            lines = [(c1, c2, colours[c1]) for c1, c2 in bones.tolist()]
+            circles = list(colours.items())
+            tables = (bones, bone_colours, points, point_colours, lines,
+                      circles)
+            self._section_cache[key] = tables
+        return tables
+
     ###########################################################################
     # Compute colours and bone structure
     ###########################################################################
 
-    def _compute_colours(self, landmarks):
+    @staticmethod
+    def _compute_colours(lm_index):
         """
         Computes colours for each landmark based on the landmark list.
         Each section of the skeleton has a defined colour range. This function
@@ -196,26 +270,19 @@ class _Skeleton:
         how many joints there are in the given configuration.
         Parameters
         ----------
-        landmarks : list of strings
-            Names of tha landmarks in the given configuration
+        lm_index : dict
+            Maps the names of the landmarks in the given configuration to
+            their index
+
+        Returns
+        -------
+        Dictionary of {landmark id: colour} dictionaries for each section.
         """
-        self._colours = {sec: {}
-                         for sec in _Skeleton.Sections
-                         }  # MAIN HEAD FACE HANDS FEET OBJECTS
+        colours = {sec: {}
+                   for sec in _Skeleton.Sections
+                   }  # MAIN HEAD FACE HANDS FEET OBJECTS
         for body_part, joints in _Skeleton._body_parts.items():
-            if (body_part == "spine" or body_part == "arm"
-                    or body_part == "leg"):
-                skeleton_sec = _Skeleton.Sections.MAIN
-            elif body_part == "head":
-                skeleton_sec = _Skeleton.Sections.HEAD
-            elif body_part == "face":
-                skeleton_sec = _Skeleton.Sections.FACE
-            elif body_part == "hand":
-                skeleton_sec = _Skeleton.Sections.HANDS
-            elif body_part == "foot":
-                skeleton_sec = _Skeleton.Sections.FEET
-            elif body_part == "objects":
-                skeleton_sec = _Skeleton.Sections.OBJECTS
+            skeleton_sec = _Skeleton._body_part_sections[body_part]
             # body parts for asembly are side agnostic, colours are not
             # => add side key to sided body parts for colouring
             if body_part in _Skeleton._sided_bodyparts:
@@ -226,78 +293,86 @@ class _Skeleton:
                 if isinstance(_Skeleton._part_colours[side + body_part],
                               tuple):
                     for joint in joints.keys():
-                        if side + joint in landmarks:
-                            self._colours[skeleton_sec][landmarks.index(
-                                side +
-                                joint)] = _Skeleton._part_colours[side +
-                                                                  body_part]
+                        if side + joint in lm_index:
+                            colours[skeleton_sec][lm_index[
+                                side + joint]] = _Skeleton._part_colours[
+                                    side + body_part]
                 else:
                     # Find all landmarks that exist in the given config
                     part_joints = []
                     for joint in joints:
-                        if side + joint in landmarks:
-                            part_joints.append(landmarks.index(side + joint))
+                        if side + joint in lm_index:
+                            part_joints.append(lm_index[side + joint])
                     # Colour each existing landmarks of the current set
                     # gradually shifting the colour going along the part
                     if len(part_joints) > 0:
-                        for i, joint in enumerate(part_joints):
-                            if len(part_joints) > 1:
-                                t = i / (len(part_joints) - 1)
-                            else:
-                                t = 1
-                            self._colours[skeleton_sec][joint] = tuple(
-                                (int(_Skeleton._part_colours[
-                                    side + body_part]["start"][j] * (1 - t) +
-                                     _Skeleton._part_colours[
-                                         side + body_part]["end"][j] * t)
-                                 for j in range(3)))
+                        if len(part_joints) > 1:
+                            t = (np.arange(len(part_joints)) /
+                                 (len(part_joints) - 1))[:, None]
+                        else:
+                            t = np.ones((1, 1))
+                        part_colours = _Skeleton._part_colours[side +
+                                                               body_part]
+                        start = np.asarray(part_colours["start"])
+                        end = np.asarray(part_colours["end"])
+                        joint_colours = (start * (1 - t) +
+                                         end * t).astype(int).tolist()
+                        for joint, colour in zip(part_joints, joint_colours):
+                            colours[skeleton_sec][joint] = tuple(colour)
+        return colours
 
-    def _compute_bones(self, landmarks):
+    @staticmethod
+    def _compute_bones(lm_index):
         """
         Work out all the possible skeletal connections.
         I can later choose which subsets of them to use to build skeletons of
         varying detail.
         Parameters
         ----------
-        landmarks : list of strings
-            Names of tha landmarks in the given configuration
+        lm_index : dict
+            Maps the names of the landmarks in the given configuration to
+            their index
+
+        Returns
+        -------
+        Dictionary of (N,2) arrays of bones (landmark ids) for each section.
         """
-        self._bones = {sec: []
-                       for sec in _Skeleton.Sections
-                       }  # MAIN HEAD FACE HANDS FEET OBJECTS
+        bones = {sec: []
+                 for sec in _Skeleton.Sections
+                 }  # MAIN HEAD FACE HANDS FEET OBJECTS
         # ---> MAIN
-        self._bones[_Skeleton.Sections.
-                    MAIN] = _Skeleton._connect_sequence_symmetrically(
-                        landmarks, _Skeleton._body_parts["arm"])
+        bones[_Skeleton.Sections.
+              MAIN] = _Skeleton._connect_sequence_symmetrically(
+                  lm_index, _Skeleton._body_parts["arm"])
         # Work out connections of shoulder to spine and each other
         for shoulder_joint in ("clavicle", "shoulder"):
-            if _Skeleton._sides[0] + shoulder_joint in landmarks:
-                self._bones[_Skeleton.Sections.MAIN].extend(
-                    _Skeleton._limb2spine(landmarks, shoulder_joint,
+            if _Skeleton._sides[0] + shoulder_joint in lm_index:
+                bones[_Skeleton.Sections.MAIN].extend(
+                    _Skeleton._limb2spine(lm_index, shoulder_joint,
                                           ("shoulder centre", "neck"),
                                           _Skeleton._body_parts["spine"][3:]))
                 break
 
-        self._bones[_Skeleton.Sections.MAIN].extend(
+        bones[_Skeleton.Sections.MAIN].extend(
             _Skeleton._connect_sequence_symmetrically(
-                landmarks, _Skeleton._body_parts["leg"]))
+                lm_index, _Skeleton._body_parts["leg"]))
         # Work out connections of hips to spine and each other
-        self._bones[_Skeleton.Sections.MAIN].extend(
-            _Skeleton._limb2spine(landmarks, "hip", ("pelvis", ),
+        bones[_Skeleton.Sections.MAIN].extend(
+            _Skeleton._limb2spine(lm_index, "hip", ("pelvis", ),
                                   _Skeleton._body_parts["spine"][-2:2:-1]))
 
-        self._bones[_Skeleton.Sections.MAIN].extend(
-            _Skeleton._connect_sequence(landmarks,
+        bones[_Skeleton.Sections.MAIN].extend(
+            _Skeleton._connect_sequence(lm_index,
                                         _Skeleton._body_parts["spine"]))
         # ---> HEAD
-        self._bones[_Skeleton.Sections.HEAD] = _Skeleton._connect_sequence(
-            landmarks, _Skeleton._body_parts["head"])
+        bones[_Skeleton.Sections.HEAD] = _Skeleton._connect_sequence(
+            lm_index, _Skeleton._body_parts["head"])
         # connect the head to the top-most point of the spine
         for head_pt in _Skeleton._body_parts["head"][::-1]:
             for top_spine in _Skeleton._body_parts["spine"]:
-                if head_pt in landmarks and top_spine in landmarks:
-                    self._bones[_Skeleton.Sections.HEAD].append(
-                        (landmarks.index(head_pt), landmarks.index(top_spine)))
+                if head_pt in lm_index and top_spine in lm_index:
+                    bones[_Skeleton.Sections.HEAD].append(
+                        (lm_index[head_pt], lm_index[top_spine]))
                     break
             else:
                 # if there was no break we need to keep searching
@@ -305,19 +380,22 @@ class _Skeleton:
             # if there was a break we are done
             break
         # ---> FACE
-        self._bones[
-            _Skeleton.Sections.FACE] = _Skeleton._connect_tree_symmetrically(
-                landmarks, _Skeleton._body_parts["face"])
+        bones[_Skeleton.Sections.FACE] = _Skeleton._connect_tree_symmetrically(
+            lm_index, _Skeleton._body_parts["face"])
         # ---> HANDS and FEET
-        self._bones[
+        bones[
             _Skeleton.Sections.HANDS] = _Skeleton._connect_tree_symmetrically(
-                landmarks, _Skeleton._body_parts["hand"])
-        self._bones[
-            _Skeleton.Sections.FEET] = _Skeleton._connect_tree_symmetrically(
-                landmarks, _Skeleton._body_parts["foot"])
+                lm_index, _Skeleton._body_parts["hand"])
+        bones[_Skeleton.Sections.FEET] = _Skeleton._connect_tree_symmetrically(
+            lm_index, _Skeleton._body_parts["foot"])
         # ---> OBJECTS
-        self._bones[_Skeleton.Sections.OBJECTS] = _Skeleton._connect_sequence(
-            landmarks, _Skeleton._body_parts["objects"])
+        bones[_Skeleton.Sections.OBJECTS] = _Skeleton._connect_sequence(
+            lm_index, _Skeleton._body_parts["objects"])
+        # Store the bones of each section as a (N,2) array of landmark ids
+        for sec in bones:
+            bones[sec] = np.array(bones[sec], dtype=np.int32).reshape(-1, 2)
+            bones[sec].flags.writeable = False
+        return bones
 
     ##################################################
     # Some of the bone structures have good regularity and can be build up in a
@@ -325,13 +403,14 @@ class _Skeleton:
     ##################################################
 
     @staticmethod
-    def _connect_sequence_symmetrically(landmarks, connection_list):
+    def _connect_sequence_symmetrically(lm_index, connection_list):
         """
         Wrapper for sequential connections to be made on both body sides.
         Parameters
         ----------
-        landmarks : list of strings
-            Names of tha landmarks in the given configuration
+        lm_index : dict
+            Maps the names of the landmarks in the given configuration to
+            their index
         connection_list : list of strings
             One of the lists describing the structure of a bodypart defined at
             the top of this class.
@@ -340,17 +419,18 @@ class _Skeleton:
         for side in _Skeleton._sides:
             connections.extend(
                 _Skeleton._connect_sequence(
-                    landmarks, [side + lm for lm in connection_list]))
+                    lm_index, [side + lm for lm in connection_list]))
         return connections
 
     @staticmethod
-    def _connect_tree_symmetrically(landmarks, connection_dict):
+    def _connect_tree_symmetrically(lm_index, connection_dict):
         """
         Wrapper for tree connections to be made on both body sides.
         Parameters
         ----------
-        landmarks : list of strings
-            Names of tha landmarks in the given configuration
+        lm_index : dict
+            Maps the names of the landmarks in the given configuration to
+            their index
         connection_dict : dictionary
             One of the dictionaries describing the structure of a bodypart
             defined at the top of this class.
@@ -358,59 +438,59 @@ class _Skeleton:
         connections = []
         for side in _Skeleton._sides:
             connections.extend(
-                _Skeleton._connect_tree(landmarks, {
+                _Skeleton._connect_tree(lm_index, {
                     side + key: side + val
                     for key, val in connection_dict.items()
                 }))
         return connections
 
     @staticmethod
-    def _connect_tree(landmarks, connection_dict):
+    def _connect_tree(lm_index, connection_dict):
         """
         Work out tree structure of a body part.
         Parameters
         ----------
-        landmarks : list of strings
-            Names of tha landmarks in the given configuration
+        lm_index : dict
+            Maps the names of the landmarks in the given configuration to
+            their index
         connection_dict : dictionary
             One of the dictionaries describing the structure of a bodypart
             defined at the top of this class.
         """
         connections = []
         for src, dest in connection_dict.items():
-            if src in landmarks and dest in landmarks:
-                connections.append(
-                    (landmarks.index(src), landmarks.index(dest)))
+            if src in lm_index and dest in lm_index:
+                connections.append((lm_index[src], lm_index[dest]))
         return connections
 
     @staticmethod
-    def _connect_sequence(landmarks, connection_list):
+    def _connect_sequence(lm_index, connection_list):
         """
         Work out the sequential structure of a body part.
         Parameters
         ----------
-        landmarks : list of strings
-            Names of tha landmarks in the given configuration
+        lm_index : dict
+            Maps the names of the landmarks in the given configuration to
+            their index
         connection_list : list of strings
             One of the lists describing the structure of a bodypart defined at
             the top of this class.
         """
         connections = []
         pt_it = iter(connection_list)
-        # Find initial point of sequence that exists in landmarks list
+        # Find initial point of sequence that exists in the landmarks
         for pt in pt_it:
-            if pt in landmarks:
+            if pt in lm_index:
                 break
         # Find the next one to match and move along
         for next_pt in pt_it:
-            if next_pt in landmarks:
-                connections.append(
-                    (landmarks.index(pt), landmarks.index(next_pt)))
+            if next_pt in lm_index:
+                connections.append((lm_index[pt], lm_index[next_pt]))
                 pt = next_pt
         return connections
 
     @staticmethod
-    def _limb2spine(landmarks, limb_end, spine_attachment, spine_list):
+    def _limb2spine(lm_index, limb_end, spine_attachment, spine_list):
         """
         Work out how to connect either the arms or the legs to the spine.
         Shoulders have a set of preferred attachment points along the spine, if
@@ -420,8 +500,8 @@ class _Skeleton:
         to form a square for the torso.
         Parameters
         ----------
-        landmarks :
-            The list of landmarks in the given config
+        lm_index :
+            Maps the landmarks in the given config to their index
         limb_end :
             'shoulder' or 'hip'
         spine_attachment :
@@ -431,12 +511,10 @@ class _Skeleton:
             the spine
         """
         connections = []
-        limb_ends = [
-            landmarks.index(side + limb_end) for side in _Skeleton._sides
-        ]
+        limb_ends = [lm_index[side + limb_end] for side in _Skeleton._sides]
         for attachment in spine_attachment:
-            if attachment in landmarks:
-                lm = landmarks.index(attachment)
+            if attachment in lm_index:
+                lm = lm_index[attachment]
                 for end in limb_ends:
                     connections.append((end, lm))
                 break
@@ -446,8 +524,8 @@ class _Skeleton:
             connections.append(tuple(limb_ends))
             # Also connect to the first suitable point along the spine
             for next_spine in spine_list:
-                if next_spine in landmarks:
-                    lm = landmarks.index(next_spine)
+                if next_spine in lm_index:
+                    lm = lm_index[next_spine]
                     for end in limb_ends:
                         connections.append((end, lm))
                     break
@@ -457,5 +535,32 @@ class _Skeleton:
                 if limb_end != "hip":
                     for i, side in enumerate(_Skeleton._sides):
                         connections.append(
-                            (limb_ends[i], landmarks.index(side + "hip")))
+                            (limb_ends[i], lm_index[side + "hip"]))
         return connections
+
+
+@lru_cache(maxsize=32)
+def _build_skeleton_tables(landmarks):
+    """
+    Compute the bones and colours of the skeleton for a landmark configuration.
+    This only depends on the landmarks, so results are cached and skeleton
+    objects of the same configuration share them. They must therefore never be
+    modified in place.
+    Parameters
+    ----------
+    landmarks : tuple of strings
+        Names of the landmarks in the given configuration
+
+    Returns
+    -------
+    (bones, colours)
+        bones : dict of (N,2) arrays of bones for each section
+        colours : dict of {landmark id: colour} dicts for each section
+    """
+    # Map landmark names to indices once so that building the skeleton uses
+    # constant time lookups instead of repeated list searches.
+    lm_index = {}
+    for index, landmark in enumerate(landmarks):
+        lm_index.setdefault(landmark, index)
+    return (_Skeleton._compute_bones(lm_index),
+            _Skeleton._compute_colours(lm_index))
@@ -8,7 +8,6 @@ class Skeleton2D(_Skeleton):
     """
     Class to visualise 2D skeletons on neutral background or original RGB.
     """
-
     ###########################################################################
     # 2D drawing functions
     ###########################################################################
@@ -40,26 +39,59 @@ class Skeleton2D(_Skeleton):
         -------
         img (h,w,c) with skeleton drawn on.
         """
-        rounded_keypoints = np.around(keypoints).astype(np.int32)
+        rounded_keypoints = np.rint(keypoints,
+                                    out=np.empty(np.shape(keypoints),
+                                                 dtype=np.int32),
+                                    casting="unsafe")
         if img is None:
             if img_filename is not None:
                 img = cv2.imread(img_filename)
-                img = cv2.cvtColor(img, cv2.COLOR_BGR2RGB)
+                cv2.cvtColor(img, cv2.COLOR_BGR2RGB, dst=img)
             else:
-                rounded_keypoints -= np.amin(rounded_keypoints, axis=0) - 10
-                dims = (np.amax(rounded_keypoints, axis=0) // 10) * 10 + 20
+                kp_min = rounded_keypoints.min(axis=0)
+                kp_max = rounded_keypoints.max(axis=0)
+                rounded_keypoints -= kp_min - 10
+                dims = ((kp_max - kp_min + 10) // 10) * 10 + 20
                 img = np.zeros(tuple(dims[::-1]) + (3, ), dtype=np.uint8)
+        return self._draw_prerounded(rounded_keypoints, img, skeleton_sections,
+                                     radius)
+
+    def _draw_prerounded(self, rounded_keypoints, img, skeleton_sections,
+                         radius):
+        """
+        Draw skeleton onto the given image from integer pixel coordinates.
+        Does the actual drawing for draw, allowing animate to round the
+        keypoints of all frames at once instead of frame by frame.
+
+        Parameters
+        ----------
+        rounded_keypoints : numpy array
+            The keypoints to be drawn, already rounded to int
+        img : numpy array
+            Image to draw on
+        skeleton_sections : _Skeleton.Sections flags
+            Selection of shich sections of the skeleton to draw
+        radius :  int or None
+            Radius for points to be drawn, class property radius if None
+
+        Returns
+        -------
+        img (h,w,c) with skeleton drawn on.
+        """
         if radius is None:
             radius = self._radius
 
-        colours = self.get_colour_dict(skeleton_sections)
-        for c1, c2 in self.get_bone_list(skeleton_sections):
-            cv2.line(img, tuple(rounded_keypoints[c1, 0:2]),
-                     tuple(rounded_keypoints[c2, 0:2]), colours[c1],
-                     max(radius // 2, 1))
-        for i, colour in colours.items():
-            cv2.circle(img, tuple(rounded_keypoints[i, 0:2]), radius, colour,
-                       -1)
+        lines, circles = self._section_tables(skeleton_sections)[4:]
+        # Convert coordinates to plain ints once instead of building tuples of
+        # numpy scalars for every bone and point
+        xs = rounded_keypoints[:, 0].tolist()
+        ys = rounded_keypoints[:, 1].tolist()
+        thickness = max(radius // 2, 1)
+        for c1, c2, colour in lines:
+            cv2.line(img, (xs[c1], ys[c1]), (xs[c2], ys[c2]), colour,
+                     thickness)
+        for i, colour in circles:
+            cv2.circle(img, (xs[i], ys[i]), radius, colour, -1)
         return img
 
     def draw_frame(self,
@@ -96,7 +128,7 @@ class Skeleton2D(_Skeleton):
         video_file = cv2.VideoCapture(video_filename)
         video_file.set(cv2.CAP_PROP_POS_FRAMES, frame_id)
         __, frame = video_file.read()
-        frame = cv2.cvtColor(frame, cv2.COLOR_BGR2RGB)
+        cv2.cvtColor(frame, cv2.COLOR_BGR2RGB, dst=frame)
         self.draw(keypoints=keypoints,
                   img=frame,
                   skeleton_sections=skeleton_sections,
@@ -126,26 +158,84 @@ class Skeleton2D(_Skeleton):
         Returns
         -------
         Sequence of frames (h,w,c) with skeleton drawn on.
+
+        Raises
+        ------
+        ValueError
+            If the video has fewer frames than keypoints are given for
         """
+        rounded_keypoints = np.rint(keypoints,
+                                    out=np.empty(np.shape(keypoints),
+                                                 dtype=np.int32),
+                                    casting="unsafe")
         if video_filename is not None:
             video_file = cv2.VideoCapture(video_filename)
-            video = []
-            while (video_file.isOpened()):
-                ret, frame = video_file.read()
-                if not ret:
-                    break
-                video.append(cv2.cvtColor(frame, cv2.COLOR_BGR2RGB))
+            video = _read_video(video_file)
             video_file.release()
-            video = np.array(video)
+            if len(video) < len(keypoints):
+                raise ValueError(
+                    "Video has {} frames but keypoints have {} frames".format(
+                        len(video), len(keypoints)))
         else:
-            rounded_keypoints = (np.around(keypoints) -
-                                 np.amin(keypoints, axis=0) + 5)
-            dims = (np.amax(rounded_keypoints, axis=0) // 10) * 10 + 20
-            video = np.zeros((len(rounded_keypoints), ) + tuple(dims))
+            # Shift the skeletons onto a black background which fits the
+            # skeleton throughout the entire video, like draw does for a single
+            # frame.
+            kp_min = rounded_keypoints[..., 0:2].min(axis=(0, 1))
+            kp_max = rounded_keypoints[..., 0:2].max(axis=(0, 1))
+            rounded_keypoints[..., 0:2] -= kp_min - 10
+            dims = ((kp_max - kp_min + 10) // 10) * 10 + 20
+            video = np.zeros((len(keypoints), dims[1], dims[0], 3),
+                             dtype=np.uint8)
 
         for frame_id in range(len(keypoints)):
-            self.draw(keypoints=keypoints[frame_id],
-                      img=video[frame_id],
-                      skeleton_sections=skeleton_sections,
-                      radius=radius)
+            self._draw_prerounded(rounded_keypoints[frame_id], video[frame_id],
+                                  skeleton_sections, radius)
         return video
+
+
+def _read_video(video_file):
+    """
+    Read all frames of a video into a single (T,h,w,3) RGB array.
+    Frames are decoded straight into one buffer instead of collecting them in
+    a list and copying them into an array afterwards. The buffer is sized from
+    the frame count of the container, which is only an estimate, so it grows
+    if more frames turn up and is trimmed to the frames actually read.
+    Parameters
+    ----------
+    video_file : cv2.VideoCapture object
+        The opened video to read
+
+    Returns
+    -------
+    Sequence of frames (T,h,w,3).
+    """
+    ret, frame = video_file.read()
+    if not ret:
+        return np.empty((0, 0, 0, 3), dtype=np.uint8)
+    # Take the frame size from the decoded frame rather than the container
+    video = np.empty(
+        (max(int(video_file.get(cv2.CAP_PROP_FRAME_COUNT)), 1), ) +
+        frame.shape,
+        dtype=np.uint8)
+    frames_read = 0
+    while ret:
+        # OpenCV only decodes into the given buffer if it matches the decoded
+        # frame, otherwise it returns a newly allocated frame
+        if not np.may_share_memory(frame, video[frames_read]):
+            video[frames_read] = frame
+        cv2.cvtColor(video[frames_read],
+                     cv2.COLOR_BGR2RGB,
+                     dst=video[frames_read])
+        frames_read += 1
+        if frames_read < len(video):
+            ret, frame = video_file.read(video[frames_read])
+        else:
+            # Only grow the buffer once there actually is another frame
+            ret, frame = video_file.read()
+            if ret:
+                video = np.concatenate((video, np.empty_like(video)))
+    if frames_read < len(video):
+        # Copy rather than return a view, which would keep the whole
+        # over-allocated buffer alive
+        video = video[:frames_read].copy()
+    return video
@@ -4,6 +4,7 @@ import numpy as np
 import matplotlib.pyplot as plt
 from matplotlib.animation import FuncAnimation
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 
 from .skeleton import _Skeleton
 
@@ -51,17 +52,25 @@ class Skeleton3D(_Skeleton):
             radius = self._radius
         if ax is None:
             fig, ax = Skeleton3D.get_plot3d_view(fig)
-        colours = self.get_colour_dict(skeleton_sections)
-        for b in self.get_bone_list(skeleton_sections):
-            colour = tuple(c / 255.0 for c in colours[b[0]])
-            ax.plot(
-                keypoints[b, Skeleton3D._X],
-                keypoints[b, Skeleton3D._Y],
-                keypoints[b, Skeleton3D._Z],
-                c=colour,
-                marker="o",
-                markersize=radius,
-            )
+        bones, bone_colours, points, point_colours = self._section_tables(
+            skeleton_sections)[:4]
+        axes_order = [Skeleton3D._X, Skeleton3D._Y, Skeleton3D._Z]
+        # Draw all bones as a single collection and all joints with a single
+        # scatter rather than creating one line artist per bone. Some
+        # selections of sections may have no bones or points at all.
+        if len(bones) > 0:
+            ax.add_collection3d(
+                Line3DCollection(keypoints[bones][:, :, axes_order],
+                                 colors=bone_colours / 255.0))
+        if len(points) > 0:
+            joints = keypoints[points][:, axes_order]
+            ax.scatter(joints[:, 0],
+                       joints[:, 1],
+                       joints[:, 2],
+                       c=point_colours / 255.0,
+                       marker="o",
+                       s=radius**2,
+                       depthshade=False)
 
         Skeleton3D._axis_settings(ax, keypoints)
         return ax
@@ -75,6 +84,9 @@ class Skeleton3D(_Skeleton):
                         radius=None):
         """
         Create an animated 3D plot of a skeleton video.
+        The animation uses blitting, so each frame only redraws the bones. Any
+        full redraw of the figure, such as rotating the view interactively,
+        still redraws the entire scene.
         Parameters
         ----------
         keypoints : numpy array
@@ -97,26 +109,24 @@ class Skeleton3D(_Skeleton):
             radius = self._radius
         if ax is None:
             fig, ax = Skeleton3D.get_plot3d_view(fig)
-        bone_list = self.get_bone_list(skeleton_sections)
-        colours = self.get_colour_dict(skeleton_sections)
+        bone_list, bone_colours = self._section_tables(skeleton_sections)[:2]
         bones = [
-            ax.plot([], [], [],
-                    c=tuple(c / 255.0 for c in colours[b[0]]),
-                    marker="o",
-                    markersize=self._radius)[0] for b in bone_list
+            ax.plot([], [], [], c=colour, marker="o", markersize=radius)[0]
+            for colour in (bone_colours / 255.0).tolist()
         ]
 
         Skeleton3D._axis_settings(ax, keypoints)
 
         update_animated_plot = partial(self._update_animated_plot,
-                                       skeleton_sections=skeleton_sections)
+                                       bone_list=bone_list)
 
-        print(keypoints.shape)
         animation = FuncAnimation(fig,
                                   update_animated_plot,
                                   len(keypoints),
                                   fargs=(bones, keypoints),
-                                  interval=20)
+                                  interval=20,
+                                  blit=True,
+                                  cache_frame_data=False)
         return animation
 
     @staticmethod
@@ -158,8 +168,7 @@ class Skeleton3D(_Skeleton):
                               frame,
                               bone_plots,
                               keypoints,
-                              skeleton_sections=_Skeleton.Sections.MAIN
-                              | _Skeleton.Sections.HEAD):
+                              bone_list):
         """
         Updates the data of the animated plot to the next frame.
 
@@ -172,12 +181,20 @@ class Skeleton3D(_Skeleton):
         keypoints : np.ndarray
             The full keypoint array as passed in at creation of the animated
             plot.
+        bone_list : np.ndarray
+            (N,2) array of the bones drawn by bone_plots, in the same order
+
+        Returns
+        -------
+        bone_plots : the updated artists, for blitting
         """
-        bone_list = self.get_bone_list(skeleton_sections)
-        for i, b in enumerate(bone_list):
-            bone_plots[i].set_data(keypoints[frame, b, Skeleton3D._X],
-                                   keypoints[frame, b, Skeleton3D._Y])
-            bone_plots[i].set_3d_properties(keypoints[frame, b, Skeleton3D._Z])
+        # Gather the end points of all bones of this frame, (bones, 2, dims)
+        segments = keypoints[frame][bone_list]
+        for bone_plot, segment in zip(bone_plots, segments):
+            bone_plot.set_data(segment[:, Skeleton3D._X],
+                               segment[:, Skeleton3D._Y])
+            bone_plot.set_3d_properties(segment[:, Skeleton3D._Z])
+        return bone_plots
 
     @staticmethod
     def _axis_settings(ax, keypoints):
@@ -193,10 +210,11 @@ class Skeleton3D(_Skeleton):
             being plotted the axis limits will include the skeleton throughout
             the entire video.
         """
-        axes = tuple(i for i in range(len(keypoints.shape) - 1))
-        val_range = np.ceil(np.amax(np.ptp(keypoints, axis=axes)) * 10) / 20
-        val_centres = (np.amax(keypoints, axis=axes) +
-                       np.amin(keypoints, axis=axes)) / 2
+        flat_keypoints = keypoints.reshape(-1, keypoints.shape[-1])
+        val_min = flat_keypoints.min(axis=0)
+        val_max = flat_keypoints.max(axis=0)
+        val_range = np.ceil(np.amax(val_max - val_min) * 10) / 20
+        val_centres = (val_max + val_min) / 2
 
         ax.set_xlim3d(val_centres[Skeleton3D._X] - val_range,
                       val_centres[Skeleton3D._X] + val_range)